@@ -4,7 +4,6 @@ import (
 	"bytes"
 	"encoding/json"
 	"fmt"
-	"io"
 	"net/http"
 	"os"
 	"strings"
@@ -36,22 +35,32 @@ type ClaudeResponse struct {
 	} `json:"usage"`
 }
 
+// claudeClient is shared across calls so connections to the Claude server are kept alive and reused
+var claudeClient = &http.Client{
+	Timeout: 300 * time.Second,
+}
+
+// Claude server configuration, read from the environment once at startup
+var (
+	claudeServerURL = func() string {
+		if url := os.Getenv("CLAUDE_SERVER_URL"); url != "" {
+			return url
+		}
+		return "http://host.docker.internal:8888/claude"
+	}()
+	claudeAllowedTools = os.Getenv("CLAUDE_ALLOWED_TOOLS")
+)
+
 // callClaudeServer sends a message to the Claude Code HTTP server with optional tools
 // If no tools are specified, uses environment variable or defaults to "mcp__whatsapp"
 // If tools are specified, joins them with commas
 func callClaudeServer(prompt string, tools ...string) (string, error) {
-	// Get configuration from environment
-	claudeServer := os.Getenv("CLAUDE_SERVER_URL")
-	if claudeServer == "" {
-		claudeServer = "http://host.docker.internal:8888/claude"
-	}
-
 	// Determine allowed tools
 	var allowedTools string
 	if len(tools) > 0 {
 		allowedTools = strings.Join(tools, ",")
 	} else {
-		allowedTools = os.Getenv("CLAUDE_ALLOWED_TOOLS")
+		allowedTools = claudeAllowedTools
 	}
 
 	// Enable debug logging for Graphiti tools (when multiple tools are specified)
@@ -65,7 +74,7 @@ func callClaudeServer(prompt string, tools ...string) (string, error) {
 
 	if enableDebugLogging {
 		// Log the exact request being sent for debugging
-		fmt.Printf("Sending request to Claude MCP server: %s\n", claudeServer)
+		fmt.Printf("Sending request to Claude MCP server: %s\n", claudeServerURL)
 		fmt.Printf("Allowed tools: %s\n", allowedTools)
 	}
 
@@ -76,33 +85,22 @@ func callClaudeServer(prompt string, tools ...string) (string, error) {
 	}
 
 	// Create the HTTP request
-	httpReq, err := http.NewRequest("POST", claudeServer, bytes.NewBuffer(jsonData))
+	httpReq, err := http.NewRequest("POST", claudeServerURL, bytes.NewBuffer(jsonData))
 	if err != nil {
 		return "", fmt.Errorf("error creating request: %v", err)
 	}
 	httpReq.Header.Set("Content-Type", "application/json")
 
-	// Create a client with timeout
-	client := &http.Client{
-		Timeout: 300 * time.Second,
-	}
-
 	// Send the request
-	resp, err := client.Do(httpReq)
+	resp, err := claudeClient.Do(httpReq)
 	if err != nil {
 		return "", fmt.Errorf("error sending request: %v", err)
 	}
 	defer resp.Body.Close()
 
-	// Read the response body
-	body, err := io.ReadAll(resp.Body)
-	if err != nil {
-		return "", fmt.Errorf("error reading response: %v", err)
-	}
-
-	// Parse the response
+	// Parse the response straight from the body rather than buffering it first
 	var claudeResp ClaudeResponse
-	err = json.Unmarshal(body, &claudeResp)
+	err = json.NewDecoder(resp.Body).Decode(&claudeResp)
 	if err != nil {
 		return "", fmt.Errorf("error parsing response: %v", err)
 	}
@@ -299,10 +299,29 @@ func segmentMessagesByTopic(messages []DailySummaryMessage, groupName, date stri
 	return topicSegments, nil
 }
 
+// promptTemplates caches prompt files by path so each is read from disk only once per run
+var promptTemplates = make(map[string]string)
+
+// readPromptTemplate returns the contents of a prompt template file, reading it on first use
+func readPromptTemplate(path string) (string, error) {
+	if template, ok := promptTemplates[path]; ok {
+		return template, nil
+	}
+
+	data, err := os.ReadFile(path)
+	if err != nil {
+		return "", err
+	}
+
+	template := string(data)
+	promptTemplates[path] = template
+	return template, nil
+}
+
 // loadTopicSegmentationPrompt loads and formats the topic segmentation prompt
 func loadTopicSegmentationPrompt(messages []DailySummaryMessage, date string) (string, error) {
 	// Load the prompt template from file
-	promptTemplate, err := os.ReadFile("prompts/topic-segmentation.md")
+	promptTemplate, err := readPromptTemplate("prompts/topic-segmentation.md")
 	if err != nil {
 		return "", fmt.Errorf("failed to read topic segmentation prompt template: %v", err)
 	}
@@ -314,7 +333,7 @@ func loadTopicSegmentationPrompt(messages []DailySummaryMessage, date string) (s
 	}
 
 	// Replace placeholders in the template
-	prompt := string(promptTemplate)
+	prompt := promptTemplate
 	prompt = strings.ReplaceAll(prompt, "{{MESSAGES}}", string(messagesJSON))
 	prompt = strings.ReplaceAll(prompt, "{{DATE}}", date)
 
@@ -324,13 +343,13 @@ func loadTopicSegmentationPrompt(messages []DailySummaryMessage, date string) (s
 // loadAddEpisodePrompt loads and formats the add episode prompt for Graphiti
 func loadAddEpisodePrompt(episodeName, topicName, groupName, date, episodeBody, sourceDescription string) (string, error) {
 	// Load the prompt template from file
-	promptTemplate, err := os.ReadFile("prompts/add-episode.md")
+	promptTemplate, err := readPromptTemplate("prompts/add-episode.md")
 	if err != nil {
 		return "", fmt.Errorf("failed to read add episode prompt template: %v", err)
 	}
 
 	// Replace placeholders in the template
-	prompt := string(promptTemplate)
+	prompt := promptTemplate
 	prompt = strings.ReplaceAll(prompt, "{{EPISODE_NAME}}", episodeName)
 	prompt = strings.ReplaceAll(prompt, "{{TOPIC_NAME}}", topicName)
 	prompt = strings.ReplaceAll(prompt, "{{GROUP_NAME}}", groupName)
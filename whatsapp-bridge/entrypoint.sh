@@ -11,6 +11,15 @@ if [ -n "$DAILY_SUMMARY_TIMEZONE" ]; then
     echo "Timezone set to: $TZ"
 fi
 
+# Rotate log files that have grown past 10MB, keeping one previous copy
+# (done before cron starts so it never holds an old log open)
+for LOG_FILE in /app/store/daily-summary.log /app/store/cron.log; do
+    if [ -f "$LOG_FILE" ] && [ "$(wc -c < "$LOG_FILE")" -gt 10485760 ]; then
+        mv "$LOG_FILE" "$LOG_FILE.1"
+        echo "Rotated $LOG_FILE"
+    fi
+done
+
 # Check if daily summary is enabled
 if [ "$DAILY_SUMMARY_ENABLED" = "true" ]; then
     echo "Daily summary is enabled"
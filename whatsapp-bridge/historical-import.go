@@ -5,6 +5,7 @@ import (
 	"encoding/json"
 	"flag"
 	"fmt"
+	"math/rand"
 	"os"
 	"os/signal"
 	"syscall"
@@ -38,6 +39,7 @@ type ImportStats struct {
 const (
 	progressFile = "store/import-progress.json"
 	defaultDelay = 2 * time.Second
+	maxBackoff   = 30 * time.Second
 )
 
 var (
@@ -134,6 +136,7 @@ func main() {
 
 	// Process each day
 	successCount := 0
+	consecutiveErrors := 0
 	for i, dateStr := range dates {
 		select {
 		case <-ctx.Done():
@@ -145,7 +148,9 @@ func main() {
 			if err != nil {
 				logger.Errorf("Failed to process %s: %v", dateStr, err)
 				progress.FailedDates[dateStr] = err.Error()
+				consecutiveErrors++
 			} else {
+				consecutiveErrors = 0
 				logger.Infof("Successfully processed %s: %d messages, %d topics, %d episodes", 
 					dateStr, stats.MessagesFound, stats.TopicsCreated, stats.EpisodesAdded)
 				progress.ProcessedDates = append(progress.ProcessedDates, dateStr)
@@ -163,6 +168,11 @@ func main() {
 			// Add delay between days (except for the last one)
 			if i < len(dates)-1 {
 				delay := time.Duration(*delaySeconds) * time.Second
+				if consecutiveErrors > 0 {
+					// Back off with jitter while failures persist (e.g. Claude server unavailable)
+					backoff := min(maxBackoff, time.Duration(1<<min(consecutiveErrors, 5))*time.Second)
+					delay += time.Duration(rand.Int63n(int64(backoff)))
+				}
 				logger.Infof("Waiting %v before processing next day...", delay)
 				select {
 				case <-time.After(delay):
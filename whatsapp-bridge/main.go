@@ -14,8 +14,10 @@ import (
 	"path/filepath"
 	"reflect"
 	"strings"
+	"sync"
 	"syscall"
 	"time"
+	"unicode/utf8"
 
 	_ "github.com/mattn/go-sqlite3"
 	"github.com/mdp/qrterminal"
@@ -481,60 +483,114 @@ func handleMessage(client *whatsmeow.Client, messageStore *MessageStore, msg *ev
 		if chatJID == selfJID.String() {
 			fmt.Printf("Routing to Claude Code: %s\n", content)
 
-			// Process in a goroutine to avoid blocking
-			go func(messageContent string, messageID string, jid types.JID) {
+			// Queue for Claude; messages sent in quick succession are answered together
+			claudeBatcher.Add(client, selfJID, msg.Info.ID, content, logger)
+		}
+	}
+}
 
-				// Call Claude server
-				response, err := callClaudeServer(messageContent)
-				if err != nil {
-					logger.Errorf("Failed to call Claude server for message %s: %v", messageID, err)
-					response = fmt.Sprintf("❌ Error: %v", err)
-				}
+// claudeBatchWindow is how long to wait for further self-chat messages before calling Claude
+const claudeBatchWindow = 500 * time.Millisecond
 
-				// Send response (split if too long)
-				const maxLength = 4000
-				if len(response) > maxLength {
-					// Split into chunks
-					for i := 0; i < len(response); i += maxLength {
-						end := i + maxLength
-						if end > len(response) {
-							end = len(response)
-						}
-						chunk := response[i:end]
-
-						// Add continuation marker for non-first chunks
-						if i > 0 {
-							chunk = fmt.Sprintf("... (continued)\n%s", chunk)
-						}
-
-						replyMsg := &waProto.Message{
-							Conversation: proto.String(chunk),
-						}
-
-						if _, err := client.SendMessage(context.Background(), jid, replyMsg); err != nil {
-							logger.Errorf("Failed to send response chunk: %v", err)
-						}
-
-						// Small delay between chunks to avoid rate limiting
-						time.Sleep(500 * time.Millisecond)
-					}
-				} else {
-					// Send as single message
-					replyMsg := &waProto.Message{
-						Conversation: proto.String(response),
-					}
+// ClaudeBatcher coalesces self-chat messages that arrive within claudeBatchWindow into one Claude request
+type ClaudeBatcher struct {
+	mu         sync.Mutex
+	messages   []string
+	messageIDs []string
+	timer      *time.Timer
+}
 
-					if _, err := client.SendMessage(context.Background(), jid, replyMsg); err != nil {
-						logger.Errorf("Failed to send response: %v", err)
-					} else {
-						fmt.Printf("Claude response sent for message %s: %d characters\n", messageID, len(response))
-					}
-				}
-			}(content, msg.Info.ID, selfJID)
-		}
+var claudeBatcher = &ClaudeBatcher{}
+
+// Add queues a message and schedules a flush if one isn't already pending
+func (b *ClaudeBatcher) Add(client *whatsmeow.Client, jid types.JID, messageID, content string, logger waLog.Logger) {
+	b.mu.Lock()
+	defer b.mu.Unlock()
+
+	b.messages = append(b.messages, content)
+	b.messageIDs = append(b.messageIDs, messageID)
+
+	// The timer runs flush in its own goroutine, so the event handler never blocks on Claude
+	if b.timer == nil {
+		b.timer = time.AfterFunc(claudeBatchWindow, func() {
+			b.flush(client, jid, logger)
+		})
 	}
 }
 
+// flush sends all queued messages to Claude as a single prompt and replies with the response
+func (b *ClaudeBatcher) flush(client *whatsmeow.Client, jid types.JID, logger waLog.Logger) {
+	b.mu.Lock()
+	messages, messageIDs := b.messages, b.messageIDs
+	b.messages, b.messageIDs, b.timer = nil, nil, nil
+	b.mu.Unlock()
+
+	prompt := strings.Join(messages, "\n---\n")
+	messageID := strings.Join(messageIDs, ",")
+
+	// Call Claude server
+	response, err := callClaudeServer(prompt)
+	if err != nil {
+		logger.Errorf("Failed to call Claude server for message %s: %v", messageID, err)
+		response = fmt.Sprintf("❌ Error: %v", err)
+	}
+
+	sendClaudeResponse(client, jid, messageID, response, logger)
+}
+
+// sendClaudeResponse sends a Claude response back to the chat, splitting it into chunks if too long
+func sendClaudeResponse(client *whatsmeow.Client, jid types.JID, messageID string, response string, logger waLog.Logger) {
+	const maxLength = 4000
+	if len(response) <= maxLength {
+		// Send as single message
+		replyMsg := &waProto.Message{
+			Conversation: proto.String(response),
+		}
+
+		if _, err := client.SendMessage(context.Background(), jid, replyMsg); err != nil {
+			logger.Errorf("Failed to send response: %v", err)
+		} else {
+			fmt.Printf("Claude response sent for message %s: %d characters\n", messageID, len(response))
+		}
+		return
+	}
+
+	// Split into chunks (string slices share the underlying bytes, so no copying here)
+	for i, end := 0, 0; i < len(response); i = end {
+		// Small delay between chunks to avoid rate limiting (none needed before the first)
+		if i > 0 {
+			time.Sleep(500 * time.Millisecond)
+		}
+
+		end = i + maxLength
+		if end >= len(response) {
+			end = len(response)
+		} else {
+			// Back off to a rune boundary so multi-byte characters aren't split across chunks
+			for end > i && !utf8.RuneStart(response[end]) {
+				end--
+			}
+			if end == i {
+				// Not valid UTF-8; fall back to a hard split
+				end = i + maxLength
+			}
+		}
+		chunk := response[i:end]
+
+		// Add continuation marker for non-first chunks
+		if i > 0 {
+			chunk = fmt.Sprintf("... (continued)\n%s", chunk)
+		}
+
+		replyMsg := &waProto.Message{
+			Conversation: proto.String(chunk),
+		}
+
+		if _, err := client.SendMessage(context.Background(), jid, replyMsg); err != nil {
+			logger.Errorf("Failed to send response chunk: %v", err)
+		}
+	}
+}
 
 // DownloadMediaRequest represents the request body for the download media API
 type DownloadMediaRequest struct {
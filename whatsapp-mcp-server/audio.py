@@ -18,7 +18,7 @@ def convert_to_opus_ogg(input_file, output_file=None, bitrate="32k", sample_rate
         
     Raises:
         FileNotFoundError: If the input file doesn't exist
-        RuntimeError: If the ffmpeg conversion fails
+        RuntimeError: If the ffmpeg conversion fails or times out
     """
     if not os.path.isfile(input_file):
         raise FileNotFoundError(f"Input file not found: {input_file}")
@@ -48,17 +48,20 @@ def convert_to_opus_ogg(input_file, output_file=None, bitrate="32k", sample_rate
     ]
     
     try:
-        # Run the ffmpeg command and capture output
+        # Run the ffmpeg command, keeping only stderr for error reporting
         process = subprocess.run(
             cmd,
-            stdout=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
             stderr=subprocess.PIPE,
             text=True,
-            check=True
+            check=True,
+            timeout=300
         )
         return output_file
     except subprocess.CalledProcessError as e:
         raise RuntimeError(f"Failed to convert audio. You likely need to install ffmpeg {e.stderr}")
+    except subprocess.TimeoutExpired:
+        raise RuntimeError(f"Audio conversion timed out: {input_file}")
 
 
 def convert_to_opus_ogg_temp(input_file, bitrate="32k", sample_rate=24000):
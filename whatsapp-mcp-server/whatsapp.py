@@ -18,8 +18,13 @@ MESSAGES_DB_PATH = os.getenv(
 WHATSAPP_BRIDGE_HOST = os.getenv('WHATSAPP_BRIDGE_HOST', 'localhost')
 WHATSAPP_BRIDGE_PORT = os.getenv('WHATSAPP_BRIDGE_PORT', '8080')
 WHATSAPP_API_BASE_URL = f"http://{WHATSAPP_BRIDGE_HOST}:{WHATSAPP_BRIDGE_PORT}/api"
+WHATSAPP_SEND_URL = f"{WHATSAPP_API_BASE_URL}/send"
+WHATSAPP_DOWNLOAD_URL = f"{WHATSAPP_API_BASE_URL}/download"
 
-@dataclass
+# Shared HTTP session so calls to the bridge reuse pooled keep-alive connections
+session = requests.Session()
+
+@dataclass(slots=True)
 class Message:
     timestamp: datetime
     sender: str
@@ -30,7 +35,7 @@ class Message:
     chat_name: Optional[str] = None
     media_type: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class Chat:
     jid: str
     name: Optional[str]
@@ -44,13 +49,13 @@ class Chat:
         """Determine if chat is a group based on JID pattern."""
         return self.jid.endswith("@g.us")
 
-@dataclass
+@dataclass(slots=True)
 class Contact:
     phone_number: str
     name: Optional[str]
     jid: str
 
-@dataclass
+@dataclass(slots=True)
 class MessageContext:
     message: Message
     before: List[Message]
@@ -637,13 +642,12 @@ def send_message(recipient: str, message: str) -> Tuple[bool, str]:
         if not recipient:
             return False, "Recipient must be provided"
         
-        url = f"{WHATSAPP_API_BASE_URL}/send"
         payload = {
             "recipient": recipient,
             "message": message,
         }
         
-        response = requests.post(url, json=payload)
+        response = session.post(WHATSAPP_SEND_URL, json=payload)
         
         # Check if the request was successful
         if response.status_code == 200:
@@ -671,13 +675,12 @@ def send_file(recipient: str, media_path: str) -> Tuple[bool, str]:
         if not os.path.isfile(media_path):
             return False, f"Media file not found: {media_path}"
         
-        url = f"{WHATSAPP_API_BASE_URL}/send"
         payload = {
             "recipient": recipient,
             "media_path": media_path
         }
         
-        response = requests.post(url, json=payload)
+        response = session.post(WHATSAPP_SEND_URL, json=payload)
         
         # Check if the request was successful
         if response.status_code == 200:
@@ -711,13 +714,12 @@ def send_audio_message(recipient: str, media_path: str) -> Tuple[bool, str]:
             except Exception as e:
                 return False, f"Error converting file to opus ogg. You likely need to install ffmpeg: {str(e)}"
         
-        url = f"{WHATSAPP_API_BASE_URL}/send"
         payload = {
             "recipient": recipient,
             "media_path": media_path
         }
         
-        response = requests.post(url, json=payload)
+        response = session.post(WHATSAPP_SEND_URL, json=payload)
         
         # Check if the request was successful
         if response.status_code == 200:
@@ -744,13 +746,12 @@ def download_media(message_id: str, chat_jid: str) -> Optional[str]:
         The local file path if download was successful, None otherwise
     """
     try:
-        url = f"{WHATSAPP_API_BASE_URL}/download"
         payload = {
             "message_id": message_id,
             "chat_jid": chat_jid
         }
         
-        response = requests.post(url, json=payload)
+        response = session.post(WHATSAPP_DOWNLOAD_URL, json=payload)
         
         if response.status_code == 200:
             result = response.json()